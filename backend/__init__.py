@@ -4,6 +4,7 @@ from .dtl_processor_web import (  # noqa: F401
     DTLProcessingError,
     DTLWebProcessor,
     ProcessingResult,
+    StreamedProcessingResult,
     UploadedItem,
 )
 
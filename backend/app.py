@@ -2,22 +2,91 @@
 
 from __future__ import annotations
 
-import io
+import asyncio
+import gzip
+from functools import partial
 from typing import List, Optional
 
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .dtl_processor_web import DTLProcessingError, DTLWebProcessor, UploadedItem
 
 
+class SelectiveGZipMiddleware:
+    """Gzip bodies for clients that advertise it, leaving ZIP responses alone.
+
+    The result archives already carry deflate-compressed xlsx members, so
+    re-encoding them at the HTTP layer burns CPU for no size win; only the
+    small JSON/HTML bodies (errors, docs) benefit from transport compression.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def wrapped_send(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                # Held back until the first body frame reveals whether the
+                # response is worth compressing.
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            headers = Headers(raw=start_message["headers"])
+            body = message.get("body", b"")
+            skip = (
+                message.get("more_body", False)
+                or headers.get("Content-Type", "").startswith("application/zip")
+                or "Content-Encoding" in headers
+                or len(body) < self.minimum_size
+            )
+
+            passthrough = True
+            if skip:
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = gzip.compress(body)
+            mutable = MutableHeaders(raw=start_message["headers"])
+            mutable["Content-Encoding"] = "gzip"
+            mutable["Content-Length"] = str(len(compressed))
+            mutable.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, wrapped_send)
+
+
 app = FastAPI(
     title="Syker DTL Processor API",
     description="Serverless API for converting Syker .dtl files into Excel workbooks.",
     version="0.1.0",
 )
 
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -29,6 +98,13 @@ app.add_middleware(
 processor = DTLWebProcessor()
 
 
+@app.on_event("shutdown")
+async def shutdown_processor() -> None:
+    """Release the shared decode pool when the server stops."""
+
+    processor.close()
+
+
 @app.get("/health", summary="Health check")
 async def health_check() -> dict[str, str]:
     """Simple endpoint for uptime monitoring."""
@@ -40,17 +116,21 @@ async def _handle_conversion(files: List[UploadFile], archive_label: Optional[st
     if not files:
         raise HTTPException(status_code=400, detail="At least one file must be provided.")
 
-    uploads: List[UploadedItem] = []
-    for upload in files:
-        contents = await upload.read()
-        uploads.append(UploadedItem(filename=upload.filename or "uploaded.dtl", content=contents))
+    contents = await asyncio.gather(*(upload.read() for upload in files))
+    uploads = [
+        UploadedItem(filename=upload.filename or "uploaded.dtl", content=content)
+        for upload, content in zip(files, contents)
+    ]
 
+    loop = asyncio.get_running_loop()
     try:
-        result = processor.process_uploads(uploads, archive_label=archive_label)
+        result = await loop.run_in_executor(
+            None,
+            partial(processor.process_uploads_streaming, uploads, archive_label=archive_label),
+        )
     except DTLProcessingError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    stream = io.BytesIO(result.zip_bytes)
     headers = {
         "Content-Disposition": f"attachment; filename={result.zip_filename}",
         "X-Recognized-Files": str(result.summary.recognized_files),
@@ -58,7 +138,7 @@ async def _handle_conversion(files: List[UploadFile], archive_label: Optional[st
     }
 
     return StreamingResponse(
-        stream,
+        result.zip_chunks,
         media_type="application/zip",
         headers=headers,
     )
@@ -30,18 +30,83 @@ from __future__ import annotations
 
 import io
 import os
-import shutil
-import struct
-import tempfile
 import re
 import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from pathlib import Path, PurePosixPath
-from typing import Dict, Iterable, List, Mapping, Optional
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Final, Iterable, Iterator, List, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
+_FILE_TYPES: Final[Mapping[str, tuple[str, int, str]]] = MappingProxyType(
+    {
+        "co2days": ("*DataLogCO2Days.dtl", 39, "<f4"),
+        "co2months": ("*DataLogCO2Months.dtl", 44, "<f4"),
+        "co2year": ("*DataLogCO2Year.dtl", 43, "<f4"),
+        "doorclose": ("*DataLogDoorClose.dtl", 46, "<f4"),
+        "doordays": ("*DataLogDoorDays.dtl", 39, "<i4"),
+        "doormonth": ("*DataLogDoorMonth.dtl", 44, "<i4"),
+        "dooropen": ("*DataLogDoorOpen.dtl", 46, "<f4"),
+        "dooryear": ("*DataLogDoorYear.dtl", 43, "<i4"),
+        "wastedays": ("*DataLogWasteDays.dtl", 39, "<f4"),
+        "wastemont": ("*DataLogWasteMont.dtl", 44, "<f4"),
+        "wasteyear": ("*DataLogWasteYear.dtl", 43, "<f4"),
+        "weightdiff": ("*DataLogWeighDiff.dtl", 46, "<f4"),
+        "trendtemp": ("*TrendTemperature.dtl", 46, "<f4"),
+        "weightday": ("*WeightDay.dtl", 46, "<f4"),
+    }
+)
+
+_VALUE_COLUMNS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "co2days": "CO2 Emissions Prevented (kg)",
+        "co2months": "CO2 Emissions Prevented (kg)",
+        "co2year": "CO2 Emissions Prevented (kg)",
+        "doorclose": "Instances of Door Closures",
+        "doordays": "Instances of Door Actions",
+        "doormonth": "Door Openings per Day",
+        "dooropen": "Instances of Door Openings",
+        "dooryear": "Door Openings per Day",
+        "wastedays": "Cummulative Waste per Day (kg)",
+        "wastemont": "Total Waste per Day (kg)",
+        "wasteyear": "Total Waste per day (kg)",
+        "weightdiff": "Weight Difference across door open and close (kg)",
+        "trendtemp": "Recorded Temperature (°C)",
+        "weightday": "Recorded Weight (kg)",
+    }
+)
+
+
+def _build_suffix_dispatch(
+    file_types: Mapping[str, tuple[str, int, str]],
+) -> tuple[Mapping[str, tuple[str, int, str]], "re.Pattern[str]"]:
+    """Build an O(1) token lookup and matching regex from the glob patterns."""
+
+    dispatch: Dict[str, tuple[str, int, str]] = {}
+    for file_type, (pattern, header_length, value_dtype) in file_types.items():
+        token = pattern.lstrip("*")[: -len(".dtl")]
+        dispatch[token.lower()] = (file_type, header_length, value_dtype)
+
+    token_pattern = re.compile(
+        r"(" + "|".join(re.escape(token) for token in dispatch) + r")\.dtl$",
+        re.IGNORECASE,
+    )
+    return MappingProxyType(dispatch), token_pattern
+
+
+_SUFFIX_DISPATCH, _TOKEN_PATTERN = _build_suffix_dispatch(_FILE_TYPES)
+
+_LABEL_RE: Final["re.Pattern[str]"] = re.compile(r"[^A-Za-z0-9_-]+")
+_DASHES_RE: Final["re.Pattern[str]"] = re.compile(r"-{2,}")
+
+# Days between the Excel 1900 epoch and the unix epoch.
+_EXCEL_EPOCH_OFFSET_DAYS: Final[int] = 25569
+
 
 class DTLProcessingError(RuntimeError):
     """Raised when processing fails in a way that should surface to callers."""
@@ -115,62 +180,110 @@ class ProcessingResult:
     exported_files: List[ExportedFile]
 
 
+@dataclass
+class StreamedProcessingResult:
+    """Like :class:`ProcessingResult`, but with the archive still pending.
+
+    ``zip_chunks`` lazily produces the ZIP payload; each workbook is
+    compressed and flushed as it is written, so peak memory stays bounded
+    and the first bytes reach the client before the last file converts.
+    """
+
+    zip_filename: str
+    summary: ProcessingSummary
+    zip_chunks: Iterator[bytes]
+
+
+class _ZipChunkStream(io.RawIOBase):
+    """Unseekable write sink that hands back accumulated bytes on demand."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        chunks, self._chunks = self._chunks, []
+        return b"".join(chunks)
+
+
 class DTLWebProcessor:
     """Expose the streamlined DTL pipeline for server-side usage."""
 
-    def __init__(self, *, timezone_override: Optional[timezone] = timezone.utc):
+    def __init__(self, *, timezone_override: Optional[timezone] = timezone.utc, max_workers: Optional[int] = None):
         self.tz = timezone_override or timezone.utc
+        self._offset_seconds = int((self.tz.utcoffset(None) or timedelta()).total_seconds())
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        """Lazily create the shared decode pool, reused across requests."""
+
+        if self._executor is None:
+            if self._max_workers > 1:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+                except OSError:
+                    # Serverless/sandboxed runtimes often lack the semaphores
+                    # multiprocessing needs; threads still overlap NumPy work.
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
 
-    @staticmethod
-    def _get_file_type_definitions() -> Dict[str, tuple[str, int]]:
-        return {
-            "co2days": ("*DataLogCO2Days.dtl", 39),
-            "co2months": ("*DataLogCO2Months.dtl", 44),
-            "co2year": ("*DataLogCO2Year.dtl", 43),
-            "doorclose": ("*DataLogDoorClose.dtl", 46),
-            "doordays": ("*DataLogDoorDays.dtl", 39),
-            "doormonth": ("*DataLogDoorMonth.dtl", 44),
-            "dooropen": ("*DataLogDoorOpen.dtl", 46),
-            "dooryear": ("*DataLogDoorYear.dtl", 43),
-            "wastedays": ("*DataLogWasteDays.dtl", 39),
-            "wastemont": ("*DataLogWasteMont.dtl", 44),
-            "wasteyear": ("*DataLogWasteYear.dtl", 43),
-            "weightdiff": ("*DataLogWeighDiff.dtl", 46),
-            "trendtemp": ("*TrendTemperature.dtl", 46),
-            "weightday": ("*WeightDay.dtl", 46),
-        }
+    def close(self) -> None:
+        """Shut down the decode pool, if one was created."""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def _count_file_types_recursively(self, directory_path: Path) -> FileDiscovery:
-        file_types = self._get_file_type_definitions()
-        type_counts: Dict[str, int] = {key: 0 for key in file_types}
-        found_files: Dict[str, List[Dict[str, object]]] = {key: [] for key in file_types}
+        type_counts: Dict[str, int] = {key: 0 for key in _FILE_TYPES}
+        found_files: Dict[str, List[Dict[str, object]]] = {key: [] for key in _FILE_TYPES}
         unrecognized_count = 0
         total_recognized = 0
 
-        for root, _, files in os.walk(directory_path):
-            root_path = Path(root)
-            for filename in files:
-                if not filename.lower().endswith(".dtl"):
-                    continue
-
-                full_path = root_path / filename
-                recognized = False
-                for file_type, (pattern, header_length) in file_types.items():
-                    if fnmatch(filename, pattern):
-                        type_counts[file_type] += 1
-                        found_files[file_type].append(
-                            {
-                                "path": full_path,
-                                "filename": filename,
-                                "header_length": header_length,
-                            }
-                        )
-                        total_recognized += 1
-                        recognized = True
-                        break
-
-                if not recognized:
-                    unrecognized_count += 1
+        pending = [str(directory_path)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+
+                    filename = entry.name
+                    if not filename.lower().endswith(".dtl"):
+                        continue
+
+                    match = _TOKEN_PATTERN.search(filename)
+                    if match is None:
+                        unrecognized_count += 1
+                        continue
+
+                    file_type, header_length, value_dtype = _SUFFIX_DISPATCH[match.group(1).lower()]
+                    type_counts[file_type] += 1
+                    found_files[file_type].append(
+                        {
+                            # Kept as a string; decode converts to Path lazily.
+                            "path": entry.path,
+                            "filename": filename,
+                            "header_length": header_length,
+                            "value_dtype": value_dtype,
+                        }
+                    )
+                    total_recognized += 1
 
         return FileDiscovery(
             type_counts=type_counts,
@@ -179,191 +292,227 @@ class DTLWebProcessor:
             found_files=found_files,
         )
 
-    @staticmethod
-    def _decode_dtl_packet(packet: bytes, *, use_integer_encoding: bool = False, tz: timezone) -> Optional[Dict[str, object]]:
-        if len(packet) != 9:
-            return None
-
-        try:
-            unix_timestamp = struct.unpack("<I", packet[0:4])[0]
-            ms_data = packet[4]
-            if use_integer_encoding:
-                data_value = struct.unpack("<i", packet[5:9])[0]
-            else:
-                data_value = struct.unpack("<f", packet[5:9])[0]
-
-            dt = datetime.fromtimestamp(unix_timestamp, tz=tz)
-
-            return {
-                "date_full": dt.strftime("%Y-%m-%d"),
-                "time_full": dt.strftime("%H:%M:%S"),
-                "ms": ms_data * 10,
-                "value": data_value,
-            }
-        except (struct.error, OSError, ValueError):
-            return None
-
-    @staticmethod
-    def _validate_dtl_file(filepath: Path, header_length: int) -> bool:
-        try:
-            if not filepath.exists():
-                return False
-
-            file_size = filepath.stat().st_size
-            if file_size < header_length:
-                return False
-
-            remaining_bytes = file_size - header_length
-            return remaining_bytes % 9 == 0
-        except OSError:
-            return False
-
     def _parse_dtl_file(self, filepath: Path, header_length: int, file_type: str) -> pd.DataFrame:
-        door_patterns = ["DataLogDoorDays", "DataLogDoorMonth", "DataLogDoorYear"]
-        use_integer_encoding = any(pattern in filepath.name for pattern in door_patterns)
-
-        if not self._validate_dtl_file(filepath, header_length):
+        payload = self._read_dtl_payload(filepath, header_length)
+        if payload is None:
             return pd.DataFrame(columns=["date_full", "time_full", "ms", "value"])
 
-        records: List[Dict[str, object]] = []
+        _, _, value_dtype = _FILE_TYPES.get(file_type, ("", 0, "<f4"))
+        return self._parse_dtl_bytes(memoryview(payload), value_dtype=value_dtype)
 
+    def _parse_dtl_bytes(self, payload: memoryview, *, value_dtype: str = "<f4") -> pd.DataFrame:
+        return _decode_dtl_records(payload, value_dtype, self._offset_seconds)
+
+    @staticmethod
+    def _read_dtl_payload(filepath: Path, header_length: int) -> Optional[bytes]:
         try:
             with filepath.open("rb") as file:
-                file.seek(header_length)
-                while True:
-                    packet = file.read(9)
-                    if len(packet) < 9:
-                        break
-
-                    decoded = self._decode_dtl_packet(packet, use_integer_encoding=use_integer_encoding, tz=self.tz)
-                    if decoded is not None:
-                        records.append(decoded)
+                file_size = file.seek(0, os.SEEK_END)
+                if file_size < header_length or (file_size - header_length) % 9 != 0:
+                    return None
 
+                file.seek(header_length)
+                return file.read()
         except (OSError, IOError):
-            return pd.DataFrame(columns=["date_full", "time_full", "ms", "value"])
-
-        if not records:
-            return pd.DataFrame(columns=["date_full", "time_full", "ms", "value"])
-
-        df = pd.DataFrame(records)
-        df = df.sort_values(["date_full", "time_full"]).reset_index(drop=True)
-        return df[["date_full", "time_full", "ms", "value"]]
+            return None
 
     def _decode_all_files(self, discovery: FileDiscovery) -> Dict[str, DecodedFile]:
-        decoded_results: Dict[str, DecodedFile] = {}
+        entries: List[Dict[str, object]] = []
 
         for file_type, files_list in discovery.found_files.items():
-            if not files_list:
-                continue
-
             for file_info in files_list:
                 filepath = Path(file_info["path"])  # type: ignore[index]
                 header_length = int(file_info["header_length"])  # type: ignore[index]
 
-                df = self._parse_dtl_file(filepath, header_length, file_type)
+                entries.append(
+                    {
+                        "file_type": file_type,
+                        "original_filename": Path(file_info["filename"]).name,  # type: ignore[index]
+                        "source_file": filepath,
+                        "payload": self._read_dtl_payload(filepath, header_length),
+                        "value_dtype": file_info["value_dtype"],
+                    }
+                )
+
+        return self._decode_entries(entries)
+
+    def _decode_entries(self, entries: List[Dict[str, object]]) -> Dict[str, DecodedFile]:
+        """Decode collected payloads, fanning out to the pool for batches."""
 
-                original_filename = Path(file_info["filename"]).name  # type: ignore[index]
-                base_filename = Path(original_filename).stem
+        payloads = [entry["payload"] or b"" for entry in entries]
+        value_dtypes = [str(entry["value_dtype"]) for entry in entries]
 
-                decoded_results[base_filename] = DecodedFile(
-                    dataframe=df,
-                    file_type=file_type,
-                    source_file=filepath,
-                    original_filename=original_filename,
-                    base_filename=base_filename,
-                    record_count=len(df),
+        if len(entries) > 1:
+            frames = list(
+                self._get_executor().map(
+                    _decode_dtl_records,
+                    payloads,
+                    value_dtypes,
+                    repeat(self._offset_seconds),
+                    chunksize=4,
                 )
+            )
+        else:
+            frames = [
+                _decode_dtl_records(payload, value_dtype, self._offset_seconds)
+                for payload, value_dtype in zip(payloads, value_dtypes)
+            ]
+
+        decoded_results: Dict[str, DecodedFile] = {}
+        for entry, df in zip(entries, frames):
+            original_filename = str(entry["original_filename"])
+            base_filename = Path(original_filename).stem
+
+            decoded_results[base_filename] = DecodedFile(
+                dataframe=df,
+                file_type=str(entry["file_type"]),
+                source_file=Path(entry["source_file"]),  # type: ignore[arg-type]
+                original_filename=original_filename,
+                base_filename=base_filename,
+                record_count=len(df),
+            )
 
         return decoded_results
 
     @staticmethod
     def _sanitize_archive_label(label: str) -> str:
-        sanitized = re.sub(r"[^A-Za-z0-9_-]+", "-", label.strip())
-        sanitized = re.sub(r"-{2,}", "-", sanitized).strip("-_")
+        sanitized = _LABEL_RE.sub("-", label.strip())
+        sanitized = _DASHES_RE.sub("-", sanitized).strip("-_")
         return sanitized or "Syker_Processed_Data"
 
     @staticmethod
     def _column_mapping(file_type: str) -> Dict[str, str]:
-        value_columns = {
-            "co2days": "CO2 Emissions Prevented (kg)",
-            "co2months": "CO2 Emissions Prevented (kg)",
-            "co2year": "CO2 Emissions Prevented (kg)",
-            "doorclose": "Instances of Door Closures",
-            "doordays": "Instances of Door Actions",
-            "doormonth": "Door Openings per Day",
-            "dooropen": "Instances of Door Openings",
-            "dooryear": "Door Openings per Day",
-            "wastedays": "Cummulative Waste per Day (kg)",
-            "wastemont": "Total Waste per Day (kg)",
-            "wasteyear": "Total Waste per day (kg)",
-            "weightdiff": "Weight Difference across door open and close (kg)",
-            "trendtemp": "Recorded Temperature (°C)",
-            "weightday": "Recorded Weight (kg)",
-        }
-
-        mapping = {
+        return {
             "date_full": "Date",
             "time_full": "Time",
             "ms": "Milliseconds",
-            "value": value_columns.get(file_type, "Value"),
+            "value": _VALUE_COLUMNS.get(file_type, "Value"),
         }
-        return mapping
+
+    @staticmethod
+    def _stringify_serial_dates(df: pd.DataFrame) -> pd.DataFrame:
+        """Render the serial Date/Time columns as strings for the fallback writer."""
+
+        if df.empty:
+            return df.copy()
+
+        out = df.copy()
+        days = (out["date_full"] - _EXCEL_EPOCH_OFFSET_DAYS).to_numpy("int64")
+        seconds = (out["time_full"] * 86400).round().to_numpy("int64")
+        out["date_full"] = pd.to_datetime(days, unit="D").strftime("%Y-%m-%d")
+        out["time_full"] = pd.to_datetime(seconds, unit="s").strftime("%H:%M:%S")
+        return out
+
+    @staticmethod
+    def _write_workbook(df: pd.DataFrame, column_mapping: Dict[str, str], buffer: io.BytesIO) -> None:
+        """Write a decoded frame straight through xlsxwriter, row by row.
+
+        Bypassing ``DataFrame.to_excel`` avoids the per-cell wrapping and
+        style handling in pandas' ExcelFormatter, and writing rows strictly
+        in order allows xlsxwriter's ``constant_memory`` mode, which keeps
+        memory flat for arbitrarily large exports.
+        """
+
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(buffer, {"constant_memory": True})
+        date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+        time_format = workbook.add_format({"num_format": "hh:mm:ss"})
+        worksheet = workbook.add_worksheet("data")
+        worksheet.write_row(0, 0, [column_mapping.get(name, name) for name in df.columns])
+
+        if not df.empty:
+            dates = df["date_full"].to_numpy()
+            times = df["time_full"].to_numpy()
+            ms = df["ms"].to_numpy()
+            values = df["value"].to_numpy()
+            for index in range(len(df)):
+                row = index + 1
+                worksheet.write_number(row, 0, dates[index], date_format)
+                worksheet.write_number(row, 1, times[index], time_format)
+                worksheet.write_number(row, 2, int(ms[index]))
+                worksheet.write_number(row, 3, float(values[index]))
+
+        workbook.close()
 
     def _export_to_excel(
         self,
         decoded_data: Mapping[str, DecodedFile],
-        output_root: Path,
+        zip_file: zipfile.ZipFile,
+        archive_name: str,
         *,
         custom_columns: Optional[Dict[str, str]] = None,
     ) -> tuple[List[ExportedFile], Dict[str, int]]:
-        try:
-            import openpyxl  # noqa: F401
-        except ImportError as exc:
-            raise DTLProcessingError(
-                "openpyxl is required to export Excel files. Install it via 'pip install openpyxl'."
-            ) from exc
+        use_xlsxwriter = self._resolve_excel_engine()
 
         files_by_type: Dict[str, int] = {}
         exported_files: List[ExportedFile] = []
 
         for decoded in decoded_data.values():
-            type_folder = output_root / decoded.file_type
-            type_folder.mkdir(parents=True, exist_ok=True)
-
-            if decoded.dataframe.empty:
-                df_export = decoded.dataframe.copy()
-            else:
-                column_mapping = self._column_mapping(decoded.file_type)
-                if custom_columns:
-                    column_mapping.update(custom_columns)
-                df_export = decoded.dataframe.rename(columns=column_mapping)
-
-            excel_path = type_folder / f"{decoded.base_filename}.xlsx"
-            df_export.to_excel(excel_path, index=False, engine="openpyxl")
+            exported = self._export_one(
+                decoded,
+                zip_file,
+                archive_name,
+                use_xlsxwriter=use_xlsxwriter,
+                custom_columns=custom_columns,
+            )
 
             files_by_type.setdefault(decoded.file_type, 0)
             files_by_type[decoded.file_type] += 1
-
-            exported_files.append(
-                ExportedFile(
-                    file_type=decoded.file_type,
-                    relative_path=excel_path.relative_to(output_root.parent),
-                    record_count=decoded.record_count,
-                )
-            )
+            exported_files.append(exported)
 
         return exported_files, files_by_type
 
     @staticmethod
-    def _build_zip_bytes(folder_path: Path, archive_name: str) -> bytes:
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for file in folder_path.rglob("*"):
-                if file.is_file():
-                    relative = Path(archive_name) / file.relative_to(folder_path)
-                    zip_file.write(file, relative.as_posix())
-        buffer.seek(0)
-        return buffer.getvalue()
+    def _resolve_excel_engine() -> bool:
+        """Return whether the direct xlsxwriter path is available."""
+
+        try:
+            import xlsxwriter  # noqa: F401
+
+            return True
+        except ImportError:
+            try:
+                import openpyxl  # noqa: F401
+            except ImportError as exc:
+                raise DTLProcessingError(
+                    "xlsxwriter (or openpyxl) is required to export Excel files. "
+                    "Install it via 'pip install xlsxwriter'."
+                ) from exc
+            return False
+
+    def _export_one(
+        self,
+        decoded: DecodedFile,
+        zip_file: zipfile.ZipFile,
+        archive_name: str,
+        *,
+        use_xlsxwriter: bool,
+        custom_columns: Optional[Dict[str, str]] = None,
+    ) -> ExportedFile:
+        if decoded.dataframe.empty:
+            column_mapping: Dict[str, str] = {}
+        else:
+            column_mapping = self._column_mapping(decoded.file_type)
+            if custom_columns:
+                column_mapping.update(custom_columns)
+
+        workbook_buffer = io.BytesIO()
+        if use_xlsxwriter:
+            self._write_workbook(decoded.dataframe, column_mapping, workbook_buffer)
+        else:
+            df_export = self._stringify_serial_dates(decoded.dataframe).rename(columns=column_mapping)
+            with pd.ExcelWriter(workbook_buffer, engine="openpyxl") as writer:
+                df_export.to_excel(writer, index=False, sheet_name="data")
+
+        relative_path = Path(archive_name) / decoded.file_type / f"{decoded.base_filename}.xlsx"
+        zip_file.writestr(relative_path.as_posix(), workbook_buffer.getvalue())
+
+        return ExportedFile(
+            file_type=decoded.file_type,
+            relative_path=relative_path,
+            record_count=decoded.record_count,
+        )
 
     def process_directory(
         self,
@@ -382,84 +531,193 @@ class DTLWebProcessor:
 
         decoded = self._decode_all_files(discovery)
 
-        timestamp = datetime.now().strftime("%Y%m%d")
-        base_label_input = archive_label or "Syker_Processed_Data"
-        base_label = self._sanitize_archive_label(base_label_input)
-        folder_name = f"{base_label}-Converted{timestamp}"
-        export_root = directory / folder_name
-        export_root.mkdir(parents=True, exist_ok=True)
+        return self._build_result(
+            decoded,
+            recognized_files=discovery.total_recognized,
+            unrecognized_files=discovery.unrecognized_count,
+            custom_columns=custom_columns,
+            archive_label=archive_label,
+        )
 
-        exported_files, files_by_type = self._export_to_excel(
+    def process_uploads(
+        self,
+        uploads: Iterable[UploadedItem],
+        *,
+        custom_columns: Optional[Dict[str, str]] = None,
+        archive_label: Optional[str] = None,
+    ) -> ProcessingResult:
+        decoded, total_recognized, unrecognized_count = self._decode_uploads(uploads)
+
+        return self._build_result(
             decoded,
-            export_root,
+            recognized_files=total_recognized,
+            unrecognized_files=unrecognized_count,
             custom_columns=custom_columns,
+            archive_label=archive_label,
         )
 
-        empty_files = [decoded.original_filename for decoded in decoded.values() if decoded.is_empty]
-        failed_files: List[str] = []
+    def process_uploads_streaming(
+        self,
+        uploads: Iterable[UploadedItem],
+        *,
+        custom_columns: Optional[Dict[str, str]] = None,
+        archive_label: Optional[str] = None,
+    ) -> StreamedProcessingResult:
+        """Decode uploads eagerly but defer ZIP assembly to a chunk iterator.
 
-        zip_filename = f"{folder_name}.zip"
-        zip_bytes = self._build_zip_bytes(export_root, folder_name)
+        The summary is complete when this returns; consuming
+        ``zip_chunks`` performs the Excel export and compression
+        incrementally, one workbook at a time.
+        """
+
+        decoded, total_recognized, unrecognized_count = self._decode_uploads(uploads)
+
+        timestamp = datetime.now().strftime("%Y%m%d")
+        base_label = self._sanitize_archive_label(archive_label or "Syker_Processed_Data")
+        folder_name = f"{base_label}-Converted{timestamp}"
+
+        files_by_type: Dict[str, int] = {}
+        for item in decoded.values():
+            files_by_type.setdefault(item.file_type, 0)
+            files_by_type[item.file_type] += 1
 
         summary = ProcessingSummary(
-            recognized_files=discovery.total_recognized,
-            unrecognized_files=discovery.unrecognized_count,
+            recognized_files=total_recognized,
+            unrecognized_files=unrecognized_count,
             files_by_type=files_by_type,
-            empty_files=empty_files,
-            failed_files=failed_files,
+            empty_files=[item.original_filename for item in decoded.values() if item.is_empty],
+            failed_files=[],
         )
 
-        return ProcessingResult(
-            zip_filename=zip_filename,
-            zip_bytes=zip_bytes,
+        return StreamedProcessingResult(
+            zip_filename=f"{folder_name}.zip",
             summary=summary,
-            exported_files=exported_files,
+            zip_chunks=self._iter_zip_chunks(decoded, folder_name, custom_columns=custom_columns),
         )
 
-    def process_uploads(
+    def _iter_zip_chunks(
         self,
-        uploads: Iterable[UploadedItem],
+        decoded: Mapping[str, DecodedFile],
+        archive_name: str,
         *,
         custom_columns: Optional[Dict[str, str]] = None,
-        archive_label: Optional[str] = None,
-    ) -> ProcessingResult:
+    ) -> Iterator[bytes]:
+        use_xlsxwriter = self._resolve_excel_engine()
+
+        stream = _ZipChunkStream()
+        # xlsx members are deflate-compressed archives already; storing them
+        # uncompressed skips a second deflate pass for a negligible size cost.
+        with zipfile.ZipFile(stream, "w", zipfile.ZIP_STORED) as zip_file:
+            for item in decoded.values():
+                self._export_one(
+                    item,
+                    zip_file,
+                    archive_name,
+                    use_xlsxwriter=use_xlsxwriter,
+                    custom_columns=custom_columns,
+                )
+                chunk = stream.drain()
+                if chunk:
+                    yield chunk
+
+        chunk = stream.drain()
+        if chunk:
+            yield chunk
+
+    def _decode_uploads(self, uploads: Iterable[UploadedItem]) -> tuple[Dict[str, DecodedFile], int, int]:
         uploads = list(uploads)
         if not uploads:
             raise DTLProcessingError("At least one file must be uploaded for processing.")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            uploads_root = temp_path / "uploads"
-            uploads_root.mkdir(parents=True, exist_ok=True)
+        entries: List[Dict[str, object]] = []
+        unrecognized_count = 0
+        total_recognized = 0
+
+        for filename, content in self._expand_uploads(uploads):
+            if not filename.lower().endswith(".dtl"):
+                continue
+
+            match = _TOKEN_PATTERN.search(filename)
+            if match is None:
+                unrecognized_count += 1
+                continue
+
+            file_type, header_length, value_dtype = _SUFFIX_DISPATCH[match.group(1).lower()]
+            total_recognized += 1
+
+            entries.append(
+                {
+                    "file_type": file_type,
+                    "original_filename": Path(filename).name,
+                    "source_file": Path(filename),
+                    "payload": content[header_length:],
+                    "value_dtype": value_dtype,
+                }
+            )
+
+        if total_recognized == 0:
+            raise DTLProcessingError("No recognised .dtl files were found in the uploaded data.")
+
+        return self._decode_entries(entries), total_recognized, unrecognized_count
 
-            self._materialise_uploads(uploads, uploads_root)
+    def _build_result(
+        self,
+        decoded: Mapping[str, DecodedFile],
+        *,
+        recognized_files: int,
+        unrecognized_files: int,
+        custom_columns: Optional[Dict[str, str]] = None,
+        archive_label: Optional[str] = None,
+    ) -> ProcessingResult:
+        timestamp = datetime.now().strftime("%Y%m%d")
+        base_label_input = archive_label or "Syker_Processed_Data"
+        base_label = self._sanitize_archive_label(base_label_input)
+        folder_name = f"{base_label}-Converted{timestamp}"
 
-            result = self.process_directory(
-                uploads_root,
+        buffer = io.BytesIO()
+        # See _iter_zip_chunks: xlsx members gain nothing from re-deflating.
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zip_file:
+            exported_files, files_by_type = self._export_to_excel(
+                decoded,
+                zip_file,
+                folder_name,
                 custom_columns=custom_columns,
-                archive_label=archive_label,
             )
 
-            return result
+        empty_files = [item.original_filename for item in decoded.values() if item.is_empty]
+        failed_files: List[str] = []
+
+        summary = ProcessingSummary(
+            recognized_files=recognized_files,
+            unrecognized_files=unrecognized_files,
+            files_by_type=files_by_type,
+            empty_files=empty_files,
+            failed_files=failed_files,
+        )
+
+        return ProcessingResult(
+            zip_filename=f"{folder_name}.zip",
+            zip_bytes=buffer.getvalue(),
+            summary=summary,
+            exported_files=exported_files,
+        )
 
     @staticmethod
-    def _materialise_uploads(uploads: Iterable[UploadedItem], destination_root: Path) -> None:
+    def _expand_uploads(uploads: Iterable[UploadedItem]) -> Iterable[tuple[str, bytes]]:
+        """Yield ``(filename, content)`` pairs, inflating ZIP uploads in memory."""
+
         for index, item in enumerate(uploads):
             filename = item.filename or f"upload_{index}.dtl"
 
             buffer = io.BytesIO(item.content)
             if DTLWebProcessor._is_zip_content(buffer):
-                buffer.seek(0)
-                subfolder = destination_root / Path(f"archive_{index}")
-                subfolder.mkdir(parents=True, exist_ok=True)
                 with zipfile.ZipFile(buffer) as zf:
-                    DTLWebProcessor._safe_extract_zip(zf, subfolder)
+                    for member in zf.infolist():
+                        if not member.is_dir():
+                            yield member.filename, zf.read(member)
                 continue
 
-            relative_path = DTLWebProcessor._safe_relative_path(filename)
-            target_path = destination_root / relative_path
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            target_path.write_bytes(item.content)
+            yield filename, item.content
 
     @staticmethod
     def _is_zip_content(buffer: io.BytesIO) -> bool:
@@ -468,31 +726,44 @@ class DTLWebProcessor:
         finally:
             buffer.seek(0)
 
-    @staticmethod
-    def _safe_relative_path(filename: str) -> Path:
-        pure_path = PurePosixPath(filename)
-        normalized_parts = [part for part in pure_path.parts if part not in ("..", "")]
-        if not normalized_parts:
-            normalized_parts = ["unnamed_uploaded_file.dtl"]
-        return Path(*normalized_parts)
-
-    @staticmethod
-    def _safe_extract_zip(zf: zipfile.ZipFile, destination: Path) -> None:
-        for member in zf.infolist():
-            member_path = destination / DTLWebProcessor._safe_relative_path(member.filename)
-            if member.is_dir():
-                member_path.mkdir(parents=True, exist_ok=True)
-            else:
-                member_path.parent.mkdir(parents=True, exist_ok=True)
-                with zf.open(member) as source, member_path.open("wb") as target:
-                    shutil.copyfileobj(source, target)
-
-
-def fnmatch(filename: str, pattern: str) -> bool:
-    """Wrapper for fnmatch.fnmatch to avoid repeated imports."""
 
-    from fnmatch import fnmatch as _fnmatch
+def _decode_dtl_records(payload: bytes, value_dtype: str, offset_seconds: int) -> pd.DataFrame:
+    """Decode a header-stripped DTL payload into a DataFrame.
 
-    return _fnmatch(filename, pattern)
+    Lives at module level (and takes only picklable arguments) so it can be
+    dispatched to a ``ProcessPoolExecutor`` worker. ``value_dtype`` comes
+    from the file-type table (``<i4`` for door counters, ``<f4`` otherwise).
+    """
 
+    record_dtype = np.dtype(
+        [
+            ("ts", "<u4"),
+            ("ms", "u1"),
+            ("value", value_dtype),
+        ]
+    )
+    record_count = len(payload) // record_dtype.itemsize
+    if record_count == 0 or len(payload) % record_dtype.itemsize != 0:
+        return pd.DataFrame(columns=["date_full", "time_full", "ms", "value"])
+
+    records = np.frombuffer(payload, dtype=record_dtype, count=record_count)
+    sort_key = records["ts"].astype("int64") * 100 + records["ms"]
+    records = records[np.argsort(sort_key, kind="stable")]
+
+    # Date/Time are carried as Excel serial numbers (days since 1900 and
+    # fraction of a day); the workbook writer attaches number formats so
+    # Excel renders and sorts them natively, and the xlsx needs no
+    # shared-strings table for them.
+    shifted = records["ts"].astype("int64") + offset_seconds
+    days = shifted // 86400
+    seconds_of_day = shifted - days * 86400
+
+    return pd.DataFrame(
+        {
+            "date_full": (days + _EXCEL_EPOCH_OFFSET_DAYS).astype("float64"),
+            "time_full": seconds_of_day.astype("float64") / 86400.0,
+            "ms": records["ms"].astype("int64") * 10,
+            "value": records["value"].astype("int64" if value_dtype == "<i4" else "float64"),
+        }
+    )
 